@@ -21,7 +21,9 @@ Usage:
 """
 
 import argparse
+import heapq
 import os
+import re
 import sys
 
 
@@ -61,45 +63,63 @@ DIRS = {
 
 SKIP = {"style.css"}
 
+_BDB_STEM_RE = re.compile(r"BDB(\d+)")
+
 
 def bdb_number(filename):
     """Extract the numeric BDB id from a filename, or None."""
-    name = os.path.splitext(filename)[0]
-    try:
-        return int(name.replace("BDB", ""))
-    except ValueError:
-        return None
+    m = _BDB_STEM_RE.fullmatch(os.path.splitext(filename)[0])
+    return int(m.group(1)) if m else None
+
 
+def list_sources(src_dir, ext):
+    """Return the set of source filenames in `src_dir` ending in `ext`.
 
-def bdb_sort_key(filename):
-    """Sort BDB filenames numerically: BDB1, BDB2, ... BDB10022."""
-    n = bdb_number(filename)
-    return n if n is not None else float("inf")
+    Listed once per directory and shared by find_missing*() and
+    count_by_digits(), so each source directory is only read once.
+    """
+    return {f for f in os.listdir(src_dir) if f.endswith(ext) and f not in SKIP}
 
 
-def find_missing(src_dir, dst_dir, ext, digits):
-    """Return sorted list of filenames present in src but absent from dst,
-    filtered to entries whose BDB number ends in one of `digits`."""
-    src_files = {f for f in os.listdir(src_dir) if f.endswith(ext) and f not in SKIP}
+def _lowest(pairs, limit):
+    """Filenames of the `limit` lowest-numbered (number, filename) pairs,
+    in numeric order (BDB1, BDB2, ... BDB10022); all of them if `limit`
+    is None."""
+    if limit is None or limit >= len(pairs):
+        pairs.sort()
+    else:
+        pairs = heapq.nsmallest(limit, pairs)
+    return [f for _, f in pairs]
+
+
+def find_missing(src_files, dst_dir, digits, limit=None):
+    """Return (filenames, count) for entries present in src but absent
+    from dst, filtered to entries whose BDB number ends in one of
+    `digits`.  Only the first `limit` filenames in numeric order are
+    returned; `count` is the full total."""
     try:
         dst_files = set(os.listdir(dst_dir))
     except FileNotFoundError:
         dst_files = set()
 
+    # (number, filename) pairs: parse each name once, order by number
+    # without a key function.
     missing = []
     for f in src_files - dst_files:
         n = bdb_number(f)
         if n is not None and (n % 10) in digits:
-            missing.append(f)
+            missing.append((n, f))
 
-    return sorted(missing, key=bdb_sort_key)
+    return _lowest(missing, limit), len(missing)
 
 
-def find_missing_html(d, digits):
+def find_missing_html(d, src_files, digits, limit=None):
     """Return HTML entries ready for reassembly: the source .html exists,
     both prerequisite files (Entries_txt/*.txt and Entries_txt_fr/*.txt)
-    exist, but the output Entries_fr/*.html does not yet exist."""
-    src_files = {f for f in os.listdir(d["src"]) if f.endswith(".html") and f not in SKIP}
+    exist, but the output Entries_fr/*.html does not yet exist.
+
+    Returns (filenames, count, blocked) with filenames limited as in
+    find_missing(); blocked counts entries still awaiting a prerequisite."""
     try:
         dst_files = set(os.listdir(d["dst"]))
     except FileNotFoundError:
@@ -122,22 +142,17 @@ def find_missing_html(d, digits):
         stem = os.path.splitext(f)[0]
         txt_name = stem + ".txt"
         if txt_name in txt_files and txt_name in txt_fr_files:
-            missing.append(f)
+            missing.append((n, f))
         else:
             blocked += 1
 
-    return sorted(missing, key=bdb_sort_key), blocked
+    return _lowest(missing, limit), len(missing), blocked
 
 
-def count_by_digits(src_dir, ext, digits):
+def count_by_digits(src_files, digits):
     """Count source files whose BDB number ends in one of `digits`."""
-    total = 0
-    for f in os.listdir(src_dir):
-        if f.endswith(ext) and f not in SKIP:
-            n = bdb_number(f)
-            if n is not None and (n % 10) in digits:
-                total += 1
-    return total
+    return sum(1 for n in map(bdb_number, src_files)
+               if n is not None and (n % 10) in digits)
 
 
 def format_missing_simple(f, d):
@@ -230,10 +245,14 @@ def main():
             print(f"\n{d['label']}: source directory {d['src']} not found, skipping")
             continue
 
+        src_files = list_sources(d["src"], d["ext"])
+        src_count = count_by_digits(src_files, digits)
+        # Only the entries that will be displayed need ordering.
+        limit = 0 if args.count else max(budget, 0)
+
         if mode == "html":
-            missing, blocked = find_missing_html(d, digits)
-            src_count = count_by_digits(d["src"], d["ext"], digits)
-            n = len(missing)
+            missing, n, blocked = find_missing_html(d, src_files, digits,
+                                                    limit)
             total_missing += n + blocked
             done = src_count - n - blocked
 
@@ -242,10 +261,8 @@ def main():
                 status += f", {blocked} awaiting txt_fr"
             print(f"\n{d['label']} (ending in {digit_str}): {status}")
         else:
-            missing = find_missing(d["src"], d["dst"], d["ext"], digits)
-            n = len(missing)
+            missing, n = find_missing(src_files, d["dst"], digits, limit)
             total_missing += n
-            src_count = count_by_digits(d["src"], d["ext"], digits)
             done = src_count - n
             print(
                 f"\n{d['label']} (ending in {digit_str}): "
@@ -258,8 +275,7 @@ def main():
         show_n = min(n, budget)
         if show_n > 0:
             fmt = format_missing_html if mode == "html" else format_missing_simple
-            for f in missing[:show_n]:
-                print(fmt(f, d))
+            print("\n".join(fmt(f, d) for f in missing[:show_n]))
             if n > show_n:
                 print(f"  ... and {n - show_n} more")
             budget -= show_n
@@ -22,6 +22,7 @@ Requires: beautifulsoup4, lxml
 """
 
 import difflib
+import functools
 import os
 import re
 import sys
@@ -39,6 +40,39 @@ ENTRIES_DIR = os.path.join(BASE, "Entries")
 ENTRIES_FR_DIR = os.path.join(BASE, "Entries_fr")
 TXT_FR_DIR = os.path.join(BASE, "Entries_txt_fr")
 
+# Patterns used on every validate_html call, compiled once at import.
+_PLACEHOLDER_RE = re.compile(r"placeholder(\d+)")
+_WS_RE = re.compile(r"\s+")
+_HSPACE_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_LANGUAGE_LINE_RE = re.compile(
+    r"^(hébreu biblique|araméen biblique|hébreu tardif|"
+    r"néo-hébreu|Biblical Hebrew|Biblical Aramaic)$", re.I)
+_SUB_MARKER_RE = re.compile(r"(?<!\w)_(\d+)_(?!\w)")
+_DOUBLE_PUNCT_RE = re.compile(r"\s*([;:?!])")
+# Transitions between Hebrew/RTL (U+0590-05FF, FB1D-FB4F) and non-Hebrew
+_HEB = r"[\u0590-\u05FF\uFB1D-\uFB4F]"
+_NON = r"[^\u0590-\u05FF\uFB1D-\uFB4F\s]"
+_NON_HEB_RE = re.compile(rf"({_NON})\s*({_HEB})")
+_HEB_NON_RE = re.compile(rf"({_HEB})\s*({_NON})")
+_VERSE_COLON_RE = re.compile(r"\d+:\d+")
+_LTGT_RE = re.compile(r"[<>]")
+_BARE_AMP_RE = re.compile(r"&(?!amp;|lt;|gt;|quot;|apos;|#)")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_html(html_content):
+    """Parse an original document once and share the tree between checks.
+
+    The same original entry (or chunk) is validated against many candidate
+    French outputs during assembly retries, so its tree is cached.  French
+    candidates rarely repeat and are parsed by the caller instead; whole
+    trees are large, so only a few are kept.  Callers must treat the
+    returned soup as read-only.
+    """
+    return BeautifulSoup(html_content, "lxml")
+
+
 def extract_preserved(html_content, soup=None):
     """Extract all elements that must be preserved from HTML."""
     if soup is None:
@@ -55,7 +89,7 @@ def extract_preserved(html_content, soup=None):
         name = tag.name
 
         # Placeholders
-        m = re.match(r"placeholder(\d+)", name)
+        m = _PLACEHOLDER_RE.match(name)
         if m:
             result["placeholder_tags"].append(name)
             continue
@@ -87,10 +121,10 @@ def extract_preserved(html_content, soup=None):
 
 def normalize_ws(text):
     """Collapse whitespace for comparison."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
-def _extract_visible_text(html_content):
+def _extract_visible_text(html_content, soup=None):
     """Extract visible text from HTML using the same logic as extract_txt.py.
 
     This ensures the extracted text matches the format of Entries_txt_fr/
@@ -101,7 +135,8 @@ def _extract_visible_text(html_content):
     validated by the tag-preservation checks and should be ignored in
     the text diff.
     """
-    soup = BeautifulSoup(html_content, "lxml")
+    if soup is None:
+        soup = BeautifulSoup(html_content, "lxml")
     # Collect reflink texts before extraction (they are scholarly sigla
     # like ⅏, ᵐ5, ᵑ6, Qr — validated separately by check #4).
     reflink_texts = set()
@@ -119,9 +154,9 @@ def _extract_visible_text(html_content):
         if stripped.startswith("## SPLIT "):
             cleaned.append(stripped)
         else:
-            cleaned.append(re.sub(r"[ \t]+", " ", line).strip())
+            cleaned.append(_HSPACE_RE.sub(" ", line).strip())
     body = "\n".join(cleaned)
-    body = re.sub(r"\n{3,}", "\n\n", body)
+    body = _BLANK_LINES_RE.sub("\n\n", body)
     return body.strip(), reflink_texts
 
 
@@ -141,8 +176,7 @@ def _normalize_for_diff(text, reflink_texts=None):
         if s.startswith("## SPLIT ") or s.startswith("==="):
             continue
         # Strip language lines (checked separately by other validators)
-        if re.match(r"^(hébreu biblique|araméen biblique|hébreu tardif|"
-                    r"néo-hébreu|Biblical Hebrew|Biblical Aramaic)$", s, re.I):
+        if _LANGUAGE_LINE_RE.match(s):
             continue
         # Strip lines that are just a reflink symbol (scholarly sigla
         # like ⅏, ᵐ5, ᵑ6 — already checked by tag-preservation #4)
@@ -159,19 +193,17 @@ def _normalize_for_diff(text, reflink_texts=None):
     # Strip sup/sub markers (^text^, _N_) — tag sequence check catches
     # missing <sup>/<sub> tags, so these markers just cause false diffs
     # when txt_fr translators omit them.
-    text = re.sub(r"\^", " ", text)
-    text = re.sub(r"(?<!\w)_(\d+)_(?!\w)", r"\1", text)
+    text = text.replace("^", " ")
+    text = _SUB_MARKER_RE.sub(r"\1", text)
     # Normalize space before French double punctuation
-    text = re.sub(r"\s*([;:?!])", r" \1", text)
+    text = _DOUBLE_PUNCT_RE.sub(r" \1", text)
     # Normalize spaces at Latin↔Hebrew boundaries — tag edges make this
     # unreliable (e.g. "Zinjirli<bdbheb>יד</bdbheb>" extracts without space
     # but txt_fr has "Zinjirli יד").  Ensure exactly one space at each
-    # transition between Hebrew/RTL (U+0590-05FF, FB1D-FB4F) and non-Hebrew.
-    _HEB = r"[\u0590-\u05FF\uFB1D-\uFB4F]"
-    _NON = r"[^\u0590-\u05FF\uFB1D-\uFB4F\s]"
-    text = re.sub(rf"({_NON})\s*({_HEB})", r"\1 \2", text)
-    text = re.sub(rf"({_HEB})\s*({_NON})", r"\1 \2", text)
-    text = re.sub(r"\s+", " ", text)
+    # transition between Hebrew/RTL and non-Hebrew.
+    text = _NON_HEB_RE.sub(r"\1 \2", text)
+    text = _HEB_NON_RE.sub(r"\1 \2", text)
+    text = _WS_RE.sub(" ", text)
     return text.strip()
 
 
@@ -189,6 +221,10 @@ def _word_diff(expected, actual, context=5, max_hunks=10, merge_gap=6,
     """
     exp_words = _normalize_for_diff(expected, reflink_texts).split()
     act_words = _normalize_for_diff(actual, reflink_texts).split()
+    # Common case: the translation matches exactly — a single linear
+    # list comparison, no need to build the SequenceMatcher tables.
+    if exp_words == act_words:
+        return []
 
     sm = difflib.SequenceMatcher(None, exp_words, act_words, autojunk=False)
     opcodes = [oc for oc in sm.get_opcodes()]
@@ -260,7 +296,7 @@ def _tag_seq(soup):
     seq = []
     for tag in soup.find_all(True):
         name = tag.name
-        if re.match(r"placeholder\d+", name):
+        if _PLACEHOLDER_RE.match(name):
             seq.append(name)
             continue
         # Skip lxml-injected wrapper tags
@@ -282,6 +318,17 @@ def _tag_seq(soup):
 _FLEXIBLE_TAGS = {"highlight", "primary", "gloss", "pos", "meta", "lookup"}
 
 
+# Raw-tag form of _FLEXIBLE_TAGS, skipped by the raw tag sequence check
+_RAW_FLEX_RE = re.compile(
+    r"^</?(" + "|".join(re.escape(t) for t in _FLEXIBLE_TAGS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+# Largest raw tag sequence check 10b diffs with autojunk off.
+_RAW_DIFF_EXACT_MAX = 1000
+
+
 def _dedup_flexible(seq):
     out = []
     for tag in seq:
@@ -291,9 +338,21 @@ def _dedup_flexible(seq):
     return out
 
 
+@functools.lru_cache(maxsize=8)
+def _doc_structure(html_content):
+    """Return (extract_preserved result, tag sequence) for an original.
+
+    Like _parse_html, cached so that an original validated against many
+    French candidates is only walked once.  The result is shared —
+    treat it as read-only.
+    """
+    soup = _parse_html(html_content)
+    return extract_preserved(html_content, soup), tuple(_tag_seq(soup))
+
+
 def _normalize_tag(t):
     """Normalize whitespace inside a tag for comparison."""
-    return re.sub(r"\s+", " ", t.strip())
+    return _WS_RE.sub(" ", t.strip())
 
 
 def validate_html(orig_html, fr_html, txt_fr_content=None):
@@ -301,12 +360,27 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
 
     Returns a list of error message strings.  Empty list = pass.
     """
+    return list(_validate_html_cached(orig_html, fr_html, txt_fr_content))
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_html_cached(orig_html, fr_html, txt_fr_content):
+    """Memoized validate_html — the checks are pure, so identical inputs
+    (re-validating an unchanged retry, repeated test fixtures) reuse the
+    earlier result.  Returns a tuple so cached results can't be mutated."""
+    return tuple(_validate_html(orig_html, fr_html, txt_fr_content))
+
+
+def _validate_html(orig_html, fr_html, txt_fr_content):
     found = []
 
-    orig_soup = BeautifulSoup(orig_html, "lxml")
+    orig_soup = _parse_html(orig_html)
+    orig, orig_seq = _doc_structure(orig_html)
+    # The French side changes on every retry, so it is parsed here and
+    # its tree passed on explicitly rather than cached.
     fr_soup = BeautifulSoup(fr_html, "lxml")
-    orig = extract_preserved(orig_html, orig_soup)
     fr = extract_preserved(fr_html, fr_soup)
+    fr_seq = _tag_seq(fr_soup)
 
     # 1. Hebrew/Aramaic text preserved
     orig_heb = set(orig["hebrew_texts"])
@@ -372,25 +446,23 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
             found.append(
                 f"English book name in <ref> display text: "
                 f"\"{display_stripped}\" (in <ref ref=\"{ref_attr}\">)")
-        elif ":" in display_stripped and re.search(r"\d+:\d+", display_stripped):
+        elif ":" in display_stripped and _VERSE_COLON_RE.search(display_stripped):
             found.append(
                 f"colon in <ref> display text (use comma): "
                 f"\"{display_stripped}\" (in <ref ref=\"{ref_attr}\">)")
 
     # 7. French text content matches HTML (word-level diff via extract_text)
     if txt_fr_content is not None:
-        fr_extracted, reflink_texts = _extract_visible_text(fr_html)
+        fr_extracted, reflink_texts = _extract_visible_text(fr_html, fr_soup)
         hunks = _word_diff(txt_fr_content, fr_extracted,
                            reflink_texts=reflink_texts)
         if hunks:
             # Check if the only differences are whitespace (e.g. tag
             # boundaries inserting spaces around punctuation).
-            exp_nows = re.sub(r"\s+", "",
-                              _normalize_for_diff(txt_fr_content,
-                                                  reflink_texts))
-            got_nows = re.sub(r"\s+", "",
-                              _normalize_for_diff(fr_extracted,
-                                                  reflink_texts))
+            exp_nows = _WS_RE.sub("", _normalize_for_diff(txt_fr_content,
+                                                          reflink_texts))
+            got_nows = _WS_RE.sub("", _normalize_for_diff(fr_extracted,
+                                                          reflink_texts))
             if exp_nows == got_nows:
                 hunks.append(
                     "NOTE: whitespace-only difference — caused by "
@@ -406,8 +478,8 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
                     "  GOOD: >2 S 22,25\n"
                     "        </ref>,            → '22,25 ,'")
         # Check for literal < or > in txt_fr that must be &lt; / &gt; in HTML
-        if hunks and txt_fr_content and re.search(r"[<>]", txt_fr_content):
-            ltgt_count = len(re.findall(r"[<>]", txt_fr_content))
+        if hunks and txt_fr_content and _LTGT_RE.search(txt_fr_content):
+            ltgt_count = len(_LTGT_RE.findall(txt_fr_content))
             hunks.append(
                 f"NOTE: txt_fr contains {ltgt_count} literal '<' or '>' "
                 f"character(s). These are scholarly notation (> = preferred "
@@ -420,8 +492,10 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
     for r, count in sorted(extra_refs.items()):
         found.append(f"extra ref attribute not in original: {r} (×{count})")
 
-    # 9. Bare & (not &amp;) in French HTML — bad encoding
-    bare_amp = len(re.findall(r"&(?!amp;|lt;|gt;|quot;|apos;|#)", fr_html))
+    # 9. Bare & (not &amp;) in French HTML — bad encoding.  Most entries
+    # have no ampersand at all, so test for one before running regexes.
+    fr_has_amp = "&" in fr_html
+    bare_amp = len(_BARE_AMP_RE.findall(fr_html)) if fr_has_amp else 0
     if bare_amp:
         found.append(
             f"bare & in HTML (should be &amp; or \"et\") ({bare_amp} "
@@ -431,17 +505,20 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
     if txt_fr_content is not None:
         # Count & in txt_fr (outside of header/separator lines)
         txt_fr_amps = 0
-        for line in txt_fr_content.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("===") or line == "---":
-                continue
-            if line.startswith("## SPLIT "):
-                continue
-            txt_fr_amps += line.count("&")
+        if "&" in txt_fr_content:
+            for line in txt_fr_content.strip().split("\n"):
+                line = line.strip()
+                if not line or line.startswith("===") or line == "---":
+                    continue
+                if line.startswith("## SPLIT "):
+                    continue
+                txt_fr_amps += line.count("&")
         # Count &amp; in French HTML (in text content, not in tags/attributes)
-        fr_text = re.sub(r"<[^>]+>", "", fr_html)
-        html_amps = fr_text.count("&amp;") + len(
-            re.findall(r"&(?!amp;|lt;|gt;|quot;|apos;|#)", fr_text))
+        html_amps = 0
+        if fr_has_amp:
+            fr_text = _RAW_TAG_RE.sub("", fr_html)
+            html_amps = fr_text.count("&amp;") + len(
+                _BARE_AMP_RE.findall(fr_text))
         if txt_fr_amps > 0 and html_amps == 0:
             found.append(
                 f"txt_fr has {txt_fr_amps} '&' but French HTML has none "
@@ -458,15 +535,12 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
         end = min(len(html_src), pos + length + radius)
         snippet = html_src[start:end]
         # Collapse whitespace but keep tags
-        snippet = re.sub(r'\s+', ' ', snippet).strip()
+        snippet = _WS_RE.sub(' ', snippet).strip()
         if len(snippet) > max_len:
             snippet = snippet[:max_len]
         return snippet
 
     # 10. Tag sequence check
-    orig_seq = _tag_seq(orig_soup)
-    fr_seq = _tag_seq(fr_soup)
-
     orig_seq_cmp = _dedup_flexible(orig_seq)
     fr_seq_cmp = _dedup_flexible(fr_seq)
 
@@ -501,18 +575,24 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
             _flex_idx = {ft: 0 for ft in _FLEXIBLE_TAGS}
             _orig_flex_at = {}  # deduped seq index -> tag text
             _prev_flex = None
-            for si, key in enumerate(orig_seq):
+            # Length of _dedup_flexible(orig_seq[:si + 1]), tracked as we
+            # go: a flexible tag repeating the previous one is dropped.
+            _deduped_len = 0
+            for key in orig_seq:
                 if key in _FLEXIBLE_TAGS:
-                    if key != _prev_flex and _flex_idx[key] < len(_orig_flex_texts[key]):
-                        deduped_idx = len(_dedup_flexible(orig_seq[:si + 1])) - 1
-                        _orig_flex_at[deduped_idx] = (
-                            _orig_flex_texts[key][_flex_idx[key]])
+                    if key != _prev_flex:
+                        _deduped_len += 1
+                        if _flex_idx[key] < len(_orig_flex_texts[key]):
+                            _orig_flex_at[_deduped_len - 1] = (
+                                _orig_flex_texts[key][_flex_idx[key]])
                     _prev_flex = key
                     _flex_idx[key] += 1
                 else:
+                    _deduped_len += 1
                     _prev_flex = None
 
-            sm = difflib.SequenceMatcher(None, orig_seq_cmp, fr_seq_cmp)
+            sm = difflib.SequenceMatcher(None, orig_seq_cmp, fr_seq_cmp,
+                                         autojunk=False)
             for op, i1, i2, j1, j2 in sm.get_opcodes():
                 if op == "equal":
                     continue
@@ -556,10 +636,6 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
     # BeautifulSoup auto-completes, e.g. </p></html> added by LLM in chunks)
     # Skip flexible tags (highlight, primary, gloss) — already handled by
     # check 10 with proper merge/reorder tolerance.
-    _RAW_FLEX_RE = re.compile(
-        r"^</?(" + "|".join(re.escape(t) for t in _FLEXIBLE_TAGS) + r")\b",
-        re.IGNORECASE,
-    )
     orig_raw_matches = [(m, _normalize_tag(m.group()))
                         for m in _RAW_TAG_RE.finditer(orig_html)
                         if not _RAW_TAG_IGNORED.match(m.group())
@@ -572,7 +648,16 @@ def validate_html(orig_html, fr_html, txt_fr_content=None):
     fr_raw_tags = [t for _, t in fr_raw_matches]
 
     if orig_raw_tags != fr_raw_tags:
-        sm = difflib.SequenceMatcher(None, orig_raw_tags, fr_raw_tags)
+        # autojunk=False keeps a one-tag difference local, but the exact
+        # matcher grows roughly quadratically with the raw sequence.  With
+        # one tag dropped it takes ~20 ms at 1,000 raw tags and ~0.7 s at
+        # BDB4264's 5,621 (autojunk on: ~5 ms, same single opcode).  Only
+        # the largest entries (under 1%) go over the cap and use the
+        # default heuristic.
+        exact = (max(len(orig_raw_tags), len(fr_raw_tags))
+                 <= _RAW_DIFF_EXACT_MAX)
+        sm = difflib.SequenceMatcher(None, orig_raw_tags, fr_raw_tags,
+                                     autojunk=not exact)
         for op, i1, i2, j1, j2 in sm.get_opcodes():
             if op == "equal":
                 continue
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests for the missing-entry listing in scripts/untranslated.py."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+from untranslated import find_missing, find_missing_html, list_sources
+
+
+ALL_DIGITS = set(range(10))
+
+
+def _touch(directory, names):
+    directory.mkdir(exist_ok=True)
+    for name in names:
+        (directory / name).write_text("")
+
+
+class TestFindMissing(unittest.TestCase):
+    """find_missing returns the lowest `limit` entries and the full count."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmpdir = Path(self._tmp.name)
+        self.src = self.tmpdir / "src"
+        self.dst = self.tmpdir / "dst"
+        # BDB1..BDB30, of which BDB1..BDB5 are already translated.
+        _touch(self.src, [f"BDB{n}.txt" for n in range(1, 31)]
+               + ["style.css"])
+        _touch(self.dst, [f"BDB{n}.txt" for n in range(1, 6)])
+        self.src_files = list_sources(str(self.src), ".txt")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_limit_keeps_full_count(self):
+        files, count = find_missing(self.src_files, str(self.dst),
+                                    ALL_DIGITS, limit=3)
+        self.assertEqual(files, ["BDB6.txt", "BDB7.txt", "BDB8.txt"])
+        self.assertEqual(count, 25)
+
+    def test_numeric_order(self):
+        """BDB2 sorts before BDB10, not after BDB12 as a string would."""
+        files, count = find_missing(self.src_files, str(self.tmpdir / "none"),
+                                    {0, 2}, limit=3)
+        self.assertEqual(files, ["BDB2.txt", "BDB10.txt", "BDB12.txt"])
+        files, count = find_missing(self.src_files, str(self.dst),
+                                    ALL_DIGITS, limit=5)
+        self.assertEqual(files, ["BDB6.txt", "BDB7.txt", "BDB8.txt",
+                                 "BDB9.txt", "BDB10.txt"])
+
+    def test_limit_zero_still_counts(self):
+        files, count = find_missing(self.src_files, str(self.dst),
+                                    ALL_DIGITS, limit=0)
+        self.assertEqual(files, [])
+        self.assertEqual(count, 25)
+
+    def test_no_limit_or_large_limit_returns_all_sorted(self):
+        expected = [f"BDB{n}.txt" for n in range(6, 31)]
+        for limit in (None, 25, 100):
+            files, count = find_missing(self.src_files, str(self.dst),
+                                        ALL_DIGITS, limit=limit)
+            self.assertEqual(files, expected, f"limit={limit}")
+            self.assertEqual(count, 25)
+
+    def test_digit_filter(self):
+        files, count = find_missing(self.src_files, str(self.dst), {0, 2},
+                                    limit=2)
+        self.assertEqual(files, ["BDB10.txt", "BDB12.txt"])
+        # 10, 12, 20, 22, 30 (BDB2 is already translated)
+        self.assertEqual(count, 5)
+
+    def test_missing_destination_directory(self):
+        files, count = find_missing(self.src_files, str(self.tmpdir / "none"),
+                                    ALL_DIGITS, limit=2)
+        self.assertEqual(files, ["BDB1.txt", "BDB2.txt"])
+        self.assertEqual(count, 30)
+
+
+class TestFindMissingHtml(unittest.TestCase):
+    """find_missing_html separates ready entries from blocked ones."""
+
+    def test_ready_and_blocked_counts(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            d = {
+                "dst": str(tmpdir / "Entries_fr"),
+                "txt_dir": str(tmpdir / "Entries_txt"),
+                "txt_fr_dir": str(tmpdir / "Entries_txt_fr"),
+            }
+            _touch(tmpdir / "Entries_fr", ["BDB1.html"])
+            # BDB1..BDB12 have their English txt; BDB11 and BDB12 still
+            # await the French txt.
+            _touch(tmpdir / "Entries_txt",
+                   [f"BDB{n}.txt" for n in range(1, 13)])
+            _touch(tmpdir / "Entries_txt_fr",
+                   [f"BDB{n}.txt" for n in range(1, 11)])
+            src_files = {f"BDB{n}.html" for n in range(1, 13)}
+
+            files, count, blocked = find_missing_html(d, src_files,
+                                                      ALL_DIGITS, limit=3)
+            self.assertEqual(files, ["BDB2.html", "BDB3.html", "BDB4.html"])
+            self.assertEqual(count, 9)
+            self.assertEqual(blocked, 2)
+
+            files, count, blocked = find_missing_html(d, src_files,
+                                                      ALL_DIGITS, limit=0)
+            self.assertEqual(files, [])
+            self.assertEqual((count, blocked), (9, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
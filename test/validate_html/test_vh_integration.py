@@ -6,6 +6,7 @@ Hebrew/Aramaic preservation.
 """
 
 import os
+import re
 import sys
 import unittest
 
@@ -13,6 +14,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "scripts"
 from validate_html import validate_html
 
 
+# Issue about a <lookup> or any missing tag (case-insensitive).
+_LOOKUP_ISSUE = re.compile(r"lookup|missing tag", re.IGNORECASE)
+
+
 class TestBDB1008Full(unittest.TestCase):
     """Full BDB1008 entry — lookup display text translated, comma/semicolon
     variation between txt_fr and HTML should not cause a false positive."""
@@ -169,8 +174,9 @@ class TestLookupTranslation(unittest.TestCase):
         '</p></body></html>'
     )
 
-    def test_translated_lookup_passes(self):
-        fr = (
+    def _make_fr(self, lookup_text):
+        """Build French HTML, varying only the <lookup> display text."""
+        return (
             '<html><head></head><body>'
             '<language>h\u00e9breu biblique</language>'
             '<p><bdbheb>\u05D1\u05B8\u05BC\u05D7\u05B4\u05D9\u05E8</bdbheb> '
@@ -178,12 +184,14 @@ class TestLookupTranslation(unittest.TestCase):
             '<primary>choisi</primary>, '
             '<ref ref="Ps 106:23" b="19" cBegin="106" vBegin="23"'
             ' cEnd="106" vEnd="23" onclick="bcv(19,106,23)">Ps 106,23</ref> '
-            '<lookup onclick="bdbabb(\'Isa\')">Es<sup>3</sup></lookup> ; '
+            f'<lookup onclick="bdbabb(\'Isa\')">{lookup_text}<sup>3</sup></lookup> ; '
             '<ref ref="Isa 42:1" b="23" cBegin="42" vBegin="1"'
             ' cEnd="42" vEnd="1" onclick="bcv(23,42,1)">Es 42,1</ref> '
             '<descrip>toujours le <highlight>choisi</highlight> de Yahv\u00e9</descrip>.'
             '</p></body></html>'
         )
+
+    def test_translated_lookup_passes(self):
         txt = (
             "h\u00e9breu biblique\n"
             "\u05D1\u05B8\u05BC\u05D7\u05B4\u05D9\u05E8 nom masculin\n"
@@ -191,7 +199,7 @@ class TestLookupTranslation(unittest.TestCase):
             "Ps 106,23\n"
             "Es^3^, Es 42,1 toujours le choisi de Yahv\u00e9.\n"
         )
-        issues = validate_html(self._ORIG, fr, txt)
+        issues = validate_html(self._ORIG, self._make_fr('Es'), txt)
         lookup_issues = [i for i in issues if "lookup" in i.lower()
                          or "English book" in i]
         self.assertEqual(lookup_issues, [],
@@ -200,21 +208,7 @@ class TestLookupTranslation(unittest.TestCase):
     def test_lookup_book_abbreviation_not_flagged(self):
         """Lookup tags use scholarly abbreviations that happen to match book
         names. These should NOT be flagged."""
-        fr = (
-            '<html><head></head><body>'
-            '<language>h\u00e9breu biblique</language>'
-            '<p><bdbheb>\u05D1\u05B8\u05BC\u05D7\u05B4\u05D9\u05E8</bdbheb> '
-            '<pos>nom masculin</pos> '
-            '<primary>choisi</primary>, '
-            '<ref ref="Ps 106:23" b="19" cBegin="106" vBegin="23"'
-            ' cEnd="106" vEnd="23" onclick="bcv(19,106,23)">Ps 106,23</ref> '
-            '<lookup onclick="bdbabb(\'Isa\')">Isa<sup>3</sup></lookup> ; '
-            '<ref ref="Isa 42:1" b="23" cBegin="42" vBegin="1"'
-            ' cEnd="42" vEnd="1" onclick="bcv(23,42,1)">Es 42,1</ref> '
-            '<descrip>toujours le <highlight>choisi</highlight> de Yahv\u00e9</descrip>.'
-            '</p></body></html>'
-        )
-        issues = validate_html(self._ORIG, fr)
+        issues = validate_html(self._ORIG, self._make_fr('Isa'))
         book_issues = [i for i in issues if "English book" in i
                        and "lookup" in i.lower()]
         self.assertEqual(book_issues, [],
@@ -258,9 +252,7 @@ class TestLookupTranslation(unittest.TestCase):
             '</body></html>'
         )
         issues = validate_html(orig, fr)
-        lookup_issues = [i for i in issues if "lookup" in i.lower()
-                         or "missing tag" in i.lower()]
-        self.assertTrue(len(lookup_issues) >= 1,
+        self.assertTrue(any(_LOOKUP_ISSUE.search(i) for i in issues),
                         f"Should flag missing lookup tag: {issues}")
 
 
@@ -327,8 +319,7 @@ class TestScholarlyCodes(unittest.TestCase):
             '</body></html>'
         )
         issues = validate_html(orig, fr)
-        book_issues = [i for i in issues if "English book" in i]
-        self.assertTrue(len(book_issues) >= 1,
+        self.assertTrue(any("English book" in i for i in issues),
                         f"Should flag untranslated Isa in <ref>: {issues}")
 
 
@@ -354,8 +345,7 @@ class TestExtraHebrew(unittest.TestCase):
             '</body></html>'
         )
         issues = validate_html(orig, fr)
-        extra = [i for i in issues if "extra Hebrew" in i]
-        self.assertTrue(len(extra) >= 1,
+        self.assertTrue(any("extra Hebrew" in i for i in issues),
                         f"Should flag extra Hebrew: {issues}")
 
     def test_missing_hebrew_flagged(self):
@@ -375,8 +365,7 @@ class TestExtraHebrew(unittest.TestCase):
             '</body></html>'
         )
         issues = validate_html(orig, fr)
-        missing = [i for i in issues if "missing" in i and "bdbheb" in i]
-        self.assertTrue(len(missing) >= 1,
+        self.assertTrue(any("missing" in i and "bdbheb" in i for i in issues),
                         f"Should flag missing Hebrew: {issues}")
 
     def test_matching_hebrew_passes(self):